@@ -3,3 +3,4 @@ from ..utilities import Dispatcher
 expectation = Dispatcher("expectation")
 quadrature_expectation = Dispatcher("quadrature_expectation")
 variational_expectation = Dispatcher("variational_expectation")
+exKxz_and_eKxz = Dispatcher("exKxz_and_eKxz")
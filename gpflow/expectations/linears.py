@@ -27,7 +27,25 @@ def _E(p, kernel, _, __, ___, nghp=None):
     return tf.reduce_sum(kernel.variance * (tf.linalg.diag_part(Xcov) + Xmu ** 2), 1)
 
 
-@dispatch.expectation.register(Gaussian, kernels.Linear, InducingPoints, NoneType, NoneType)
+@dispatch.expectation.register(DiagonalGaussian, kernels.Linear, NoneType, NoneType, NoneType)
+def _E(p, kernel, _, __, ___, nghp=None):
+    """
+    Compute the expectation:
+    <diag(K_{X, X})>_p(X)
+        - K_{.,.} :: Linear kernel
+        - p       :: DiagonalGaussian distribution (p.cov NxD)
+
+    :return: N
+    """
+    # use only active dimensions
+    Xmu, Xvar = kernel.slice(p.mu, p.cov)
+
+    return tf.reduce_sum(kernel.variance * (Xvar + Xmu ** 2), 1)
+
+
+@dispatch.expectation.register(
+    (Gaussian, DiagonalGaussian), kernels.Linear, InducingPoints, NoneType, NoneType
+)
 def _E(p, kernel, inducing_variable, _, __, nghp=None):
     """
     Compute the expectation:
@@ -51,12 +69,7 @@ def _E(p, kernel, inducing_variable, mean, _, nghp=None):
 
     :return: NxMxD
     """
-    Xmu, Xcov = p.mu, p.cov
-
-    N = tf.shape(Xmu)[0]
-    var_Z = kernel.variance * inducing_variable.Z  # MxD
-    tiled_Z = tf.tile(tf.expand_dims(var_Z, 0), (N, 1, 1))  # NxMxD
-    return tf.linalg.matmul(tiled_Z, Xcov + (Xmu[..., None] * Xmu[:, None, :]))
+    return _linear_eKzxx(p, kernel, inducing_variable, "nmd")
 
 
 @dispatch.expectation.register(
@@ -71,13 +84,51 @@ def _E(p, kernel, inducing_variable, mean, _, nghp=None):
 
     :return: NxMxD
     """
+    return _linear_eKzxx(p, kernel, inducing_variable, "nmd")
+
+
+@dispatch.expectation.register(Gaussian, mfn.Identity, NoneType, kernels.Linear, InducingPoints)
+def _E(p, mean, _, kernel, inducing_variable, nghp=None):
+    """
+    Compute the expectation:
+    expectation[n] = <x_n K_{x_n, Z}>_p(x_n)
+        - K_{.,.} :: Linear kernel
+
+    :return: NxDxM
+    """
+    return _linear_eKzxx(p, kernel, inducing_variable, "ndm")
+
+
+@dispatch.expectation.register(
+    MarkovGaussian, mfn.Identity, NoneType, kernels.Linear, InducingPoints
+)
+def _E(p, mean, _, kernel, inducing_variable, nghp=None):
+    """
+    Compute the expectation:
+    expectation[n] = <x_{n+1} K_{x_n, Z}>_p(x_{n:n+1})
+        - K_{.,.} :: Linear kernel
+        - p       :: MarkovGaussian distribution (p.cov 2x(N+1)xDxD)
+
+    :return: NxDxM
+    """
+    return _linear_eKzxx(p, kernel, inducing_variable, "ndm")
+
+
+def _linear_eKzxx(p, kernel, inducing_variable, output_spec):
+    """
+    Computes <K_{Z, x_n} x_n^T>_p(x_n) for the Linear kernel, or <K_{Z, x_n} x_{n+1}^T>
+    if p is a MarkovGaussian, in the layout given by `output_spec`: "nmd" for NxMxD
+    or "ndm" for its transpose NxDxM.
+    """
     Xmu, Xcov = p.mu, p.cov
 
-    N = tf.shape(Xmu)[0] - 1
+    if isinstance(p, MarkovGaussian):
+        eXX = Xcov[1, :-1] + (Xmu[:-1][..., None] * Xmu[1:][:, None, :])  # NxDxD
+    else:
+        eXX = Xcov + (Xmu[..., None] * Xmu[:, None, :])  # NxDxD
+
     var_Z = kernel.variance * inducing_variable.Z  # MxD
-    tiled_Z = tf.tile(tf.expand_dims(var_Z, 0), (N, 1, 1))  # NxMxD
-    eXX = Xcov[1, :-1] + (Xmu[:-1][..., None] * Xmu[1:][:, None, :])  # NxDxD
-    return tf.linalg.matmul(tiled_Z, eXX)
+    return tf.einsum(f"me,ned->{output_spec}", var_Z, eXX)
 
 
 @dispatch.expectation.register(
@@ -111,9 +162,17 @@ def _E(p, kern1, feat1, kern2, feat2, nghp=None):
     inducing_variable = feat1
 
     # use only active dimensions
-    Xcov = kernel.slice_cov(tf.linalg.diag(p.cov) if isinstance(p, DiagonalGaussian) else p.cov)
     Z, Xmu = kernel.slice(inducing_variable.Z, p.mu)
 
+    if isinstance(p, DiagonalGaussian):
+        Xvar, _ = kernel.slice(p.cov)  # NxD
+        var_Z = kernel.variance * Z  # MxD
+        eKxz = tf.linalg.matmul(Xmu, var_Z, transpose_b=True)  # NxM
+        eKzxxKxz = tf.einsum("md,nd,kd->nmk", var_Z, Xvar, var_Z, optimize="optimal")  # NxMxM
+        return eKzxxKxz + eKxz[:, :, None] * eKxz[:, None, :]
+
+    Xcov = kernel.slice_cov(p.cov)
+
     N = tf.shape(Xmu)[0]
     var_Z = kernel.variance * Z
     tiled_Z = tf.tile(tf.expand_dims(var_Z, 0), (N, 1, 1))  # NxMxD
@@ -13,21 +13,6 @@ NoneType = type(None)
 # ================ exKxz transpose and mean function handling =================
 
 
-@dispatch.expectation.register(
-    (Gaussian, MarkovGaussian), mfn.Identity, NoneType, kernels.Linear, InducingPoints
-)
-def _E(p, mean, _, kernel, inducing_variable, nghp=None):
-    """
-    Compute the expectation:
-    expectation[n] = <x_n K_{x_n, Z}>_p(x_n)
-        - K_{.,} :: Linear kernel
-    or the equivalent for MarkovGaussian
-
-    :return: NxDxM
-    """
-    return tf.linalg.adjoint(expectation(p, (kernel, inducing_variable), mean))
-
-
 @dispatch.expectation.register(
     (Gaussian, MarkovGaussian), kernels.Kernel, InducingVariables, mfn.MeanFunction, NoneType
 )
@@ -55,7 +40,7 @@ def _E(p, constant_mean, _, kernel, inducing_variable, nghp=None):
     c = constant_mean(p.mu)  # NxQ
     eKxz = expectation(p, (kernel, inducing_variable), nghp=nghp)  # NxM
 
-    return c[..., None] * eKxz[:, None, :]
+    return tf.einsum("nq,nm->nqm", c, eKxz)
 
 
 @dispatch.expectation.register(Gaussian, mfn.Linear, NoneType, kernels.Kernel, InducingPoints)
@@ -68,15 +53,29 @@ def _E(p, linear_mean, _, kernel, inducing_variable, nghp=None):
 
     :return: NxQxM
     """
-    N = tf.shape(p.mu)[0]
+    exKxz, eKxz = dispatch.exKxz_and_eKxz(p, kernel, inducing_variable, nghp=nghp)
+    eAxKxz = tf.einsum("dq,ndm->nqm", linear_mean.A, exKxz)
+    ebKxz = linear_mean.b[None, :, None] * eKxz[:, None, :]
+    return eAxKxz + ebKxz
+
+
+@dispatch.exKxz_and_eKxz.register(Gaussian, kernels.Kernel, InducingPoints)
+def _exKxz_and_eKxz(p, kernel, inducing_variable, nghp=None):
+    """
+    Compute the expectations:
+    exKxz[n] = <x_n K_{x_n, Z}>_p(x_n)
+    eKxz[n] = <K_{x_n, Z}>_p(x_n)
+        - K_{.,.} :: Kernel function
+
+    Kernels for which both expectations share intermediate terms register
+    a specialised implementation; this fallback computes them separately.
+
+    :return: NxDxM, NxM
+    """
     D = tf.shape(p.mu)[1]
     exKxz = expectation(p, mfn.Identity(D), (kernel, inducing_variable), nghp=nghp)
     eKxz = expectation(p, (kernel, inducing_variable), nghp=nghp)
-    eAxKxz = tf.linalg.matmul(
-        tf.tile(linear_mean.A[None, :, :], (N, 1, 1)), exKxz, transpose_a=True
-    )
-    ebKxz = linear_mean.b[None, :, None] * eKxz[:, None, :]
-    return eAxKxz + ebKxz
+    return exKxz, eKxz
 
 
 @dispatch.expectation.register(Gaussian, mfn.Identity, NoneType, kernels.Kernel, InducingPoints)
@@ -11,7 +11,9 @@ from .expectations import expectation
 NoneType = type(None)
 
 
-@dispatch.expectation.register(Gaussian, kernels.SquaredExponential, NoneType, NoneType, NoneType)
+@dispatch.expectation.register(
+    (Gaussian, DiagonalGaussian), kernels.SquaredExponential, NoneType, NoneType, NoneType
+)
 def _E(p, kernel, _, __, ___, nghp=None):
     """
     Compute the expectation:
@@ -61,6 +63,33 @@ def _E(p, kernel, inducing_variable, _, __, nghp=None):
     return kernel.variance * (determinants[:, None] * exponent_mahalanobis)
 
 
+@dispatch.expectation.register(
+    DiagonalGaussian, kernels.SquaredExponential, InducingPoints, NoneType, NoneType
+)
+def _E(p, kernel, inducing_variable, _, __, nghp=None):
+    """
+    Compute the expectation:
+    <K_{X, Z}>_p(X)
+        - K_{.,.} :: RBF kernel
+        - p       :: DiagonalGaussian distribution (p.cov NxD)
+
+    :return: NxM
+    """
+    # use only active dimensions
+    Z, Xmu = kernel.slice(inducing_variable.Z, p.mu)
+    Xvar, _ = kernel.slice(p.cov)
+
+    L_plus_Xvar = kernel.lengthscales ** 2 + Xvar  # NxD
+
+    all_diffs = tf.transpose(Z) - tf.expand_dims(Xmu, 2)  # NxDxM
+    exponent_mahalanobis = tf.reduce_sum(tf.square(all_diffs) / L_plus_Xvar[:, :, None], 1)  # NxM
+    exponent_mahalanobis = tf.exp(-0.5 * exponent_mahalanobis)  # NxM
+
+    determinants = tf.reduce_prod(kernel.lengthscales / tf.sqrt(L_plus_Xvar), axis=1)  # N
+
+    return kernel.variance * (determinants[:, None] * exponent_mahalanobis)
+
+
 @dispatch.expectation.register(
     Gaussian, mfn.Identity, NoneType, kernels.SquaredExponential, InducingPoints
 )
@@ -72,6 +101,34 @@ def _E(p, mean, _, kernel, inducing_variable, nghp=None):
 
     :return: NxDxM
     """
+    exKxz, _ = _rbf_exKxz_and_eKxz(p, kernel, inducing_variable)
+    return exKxz
+
+
+@dispatch.exKxz_and_eKxz.register(Gaussian, kernels.SquaredExponential, InducingPoints)
+def _exKxz_and_eKxz(p, kernel, inducing_variable, nghp=None):
+    """
+    Compute the expectations:
+    exKxz[n] = <x_n K_{x_n, Z}>_p(x_n)
+    eKxz[n] = <K_{x_n, Z}>_p(x_n)
+        - K_{.,.} :: RBF kernel
+
+    :return: NxDxM, NxM
+    """
+    exKxz, eKxz = _rbf_exKxz_and_eKxz(p, kernel, inducing_variable)
+    if not (isinstance(kernel.active_dims, slice) and kernel.active_dims == slice(None)):
+        # exKxz is computed over all input dimensions, eKxz only over the active ones
+        eKxz = expectation(p, (kernel, inducing_variable), nghp=nghp)
+    return exKxz, eKxz
+
+
+def _rbf_exKxz_and_eKxz(p, kernel, inducing_variable):
+    """
+    Computes <x_n K_{x_n, Z}>_p(x_n) and <K_{x_n, Z}>_p(x_n) for the RBF
+    kernel, sharing the Cholesky factor and Mahalanobis terms between the two.
+
+    :return: NxDxM, NxM
+    """
     Xmu, Xcov = p.mu, p.cov
 
     D = tf.shape(Xmu)[1]
@@ -96,11 +153,9 @@ def _E(p, mean, _, kernel, inducing_variable, nghp=None):
     exponent_mahalanobis = tf.reduce_sum(all_diffs * exponent_mahalanobis, 1)  # NxM
     exponent_mahalanobis = tf.exp(-0.5 * exponent_mahalanobis)  # NxM
 
-    return (
-        kernel.variance
-        * (determinants[:, None] * exponent_mahalanobis)[:, None, :]
-        * non_exponent_term
-    )
+    eKxz = kernel.variance * (determinants[:, None] * exponent_mahalanobis)  # NxM
+    exKxz = eKxz[:, None, :] * non_exponent_term  # NxDxM
+    return exKxz, eKxz
 
 
 @dispatch.expectation.register(
@@ -180,7 +235,6 @@ def _E(p, kern1, feat1, kern2, feat2, nghp=None):
     inducing_variable = feat1
 
     # use only active dimensions
-    Xcov = kernel.slice_cov(tf.linalg.diag(p.cov) if isinstance(p, DiagonalGaussian) else p.cov)
     Z, Xmu = kernel.slice(inducing_variable.Z, p.mu)
 
     N = tf.shape(Xmu)[0]
@@ -192,13 +246,24 @@ def _E(p, kern1, feat1, kern2, feat2, nghp=None):
         squared_lengthscales = squared_lengthscales + zero_lengthscales
 
     sqrt_det_L = tf.reduce_prod(0.5 * squared_lengthscales) ** 0.5
-    C = tf.linalg.cholesky(0.5 * tf.linalg.diag(squared_lengthscales) + Xcov)  # NxDxD
-    dets = sqrt_det_L / tf.exp(tf.reduce_sum(tf.math.log(tf.linalg.diag_part(C)), axis=1))  # N
 
-    C_inv_mu = tf.linalg.triangular_solve(C, tf.expand_dims(Xmu, 2), lower=True)  # NxDx1
-    C_inv_z = tf.linalg.triangular_solve(
-        C, tf.tile(tf.expand_dims(0.5 * tf.transpose(Z), 0), [N, 1, 1]), lower=True
-    )  # NxDxM
+    if isinstance(p, DiagonalGaussian):
+        # C is diagonal, so the triangular solves reduce to elementwise divisions
+        Xvar, _ = kernel.slice(p.cov)
+        C = tf.sqrt(0.5 * squared_lengthscales + Xvar)  # NxD
+        dets = sqrt_det_L / tf.reduce_prod(C, axis=1)  # N
+
+        C_inv_mu = tf.expand_dims(Xmu / C, 2)  # NxDx1
+        C_inv_z = 0.5 * tf.transpose(Z) / tf.expand_dims(C, 2)  # NxDxM
+    else:
+        Xcov = kernel.slice_cov(p.cov)
+        C = tf.linalg.cholesky(0.5 * tf.linalg.diag(squared_lengthscales) + Xcov)  # NxDxD
+        dets = sqrt_det_L / tf.exp(tf.reduce_sum(tf.math.log(tf.linalg.diag_part(C)), axis=1))
+
+        C_inv_mu = tf.linalg.triangular_solve(C, tf.expand_dims(Xmu, 2), lower=True)  # NxDx1
+        C_inv_z = tf.linalg.triangular_solve(
+            C, tf.tile(tf.expand_dims(0.5 * tf.transpose(Z), 0), [N, 1, 1]), lower=True
+        )  # NxDxM
     mu_CC_inv_mu = tf.expand_dims(tf.reduce_sum(tf.square(C_inv_mu), 1), 2)  # Nx1x1
     z_CC_inv_z = tf.reduce_sum(tf.square(C_inv_z), 1)  # NxM
     zm_CC_inv_zn = tf.linalg.matmul(C_inv_z, C_inv_z, transpose_a=True)  # NxMxM
@@ -50,15 +50,31 @@ class SamplingHelper:
     :param target_log_prob_fn: a callable which represents log-density under
         the target distribution.
     :param parameters: List of :class:`gpflow.Parameter` used as a state of the Markov chain.
+    :param experimental_compile: If True, the adjusted target log probability and its
+        gradient are evaluated together in a single `tf.function` compiled with XLA, fusing
+        the per-step variable updates, log-density and log-Jacobian terms and their
+        gradient. The gradient is then computed on every call, even if only the value
+        is used. The compiled function is traced once, on its first call, and does not
+        pick up later changes to the model or its parameters (e.g. a new transform or
+        prior); construct a new `SamplingHelper` after making such changes.
     """
 
-    def __init__(self, target_log_prob_fn: LogProbabilityFunction, parameters: Parameters):
+    def __init__(
+        self,
+        target_log_prob_fn: LogProbabilityFunction,
+        parameters: Parameters,
+        experimental_compile: bool = False,
+    ):
         if not all([isinstance(p, Parameter) and p.prior is not None for p in parameters]):
             raise ValueError(f"Expected only parameters with priors")
 
         self._parameters = parameters
         self._target_log_prob_fn = target_log_prob_fn
         self._variables = [p.unconstrained_variable for p in parameters]
+        self._param_ndims = [v.shape.ndims for v in self._variables]
+        self._target_log_prob_fn_closure = self._make_target_log_prob_fn_closure(
+            experimental_compile
+        )
 
     @property
     def current_state(self):
@@ -72,27 +88,60 @@ class SamplingHelper:
         The target log probability, adjusted to allow for optimisation to occur on the tracked
         unconstrained underlying variables.
         """
+        return self._target_log_prob_fn_closure
+
+    def _make_target_log_prob_fn_closure(self, experimental_compile: bool):
+        """
+        Builds the closure returned by `target_log_prob_fn`. This is done once, in the
+        constructor, so that repeated accesses return the same function.
+        """
         variables_list = self.current_state
 
+        def _log_prob_and_tape(*variables):
+            assign_ops = [
+                v_old.assign(v_new, read_value=False)
+                for v_old, v_new in zip(variables_list, variables)
+            ]
+
+            with tf.control_dependencies(assign_ops):
+                with tf.GradientTape(watch_accessed_variables=False) as tape:
+                    tape.watch(variables_list)
+                    log_prob = self._target_log_prob_fn()
+                    # Now need to correct for the fact that the prob fn is evaluated on the
+                    # constrained space while we wish to evaluate it in the unconstrained space
+                    unconstrained_values = [v.value() for v in variables_list]
+                    log_det_jacobian = self._log_det_jacobian(unconstrained_values)
+                    if log_det_jacobian is not None:
+                        log_prob += log_det_jacobian
+
+            return log_prob, tape
+
+        if experimental_compile:
+            # The gradient is computed in the same compiled function as the value, rather than
+            # lazily in grad_fn, so that both are fused by XLA and no tape outlives the trace.
+            @tf.function(experimental_compile=True)
+            def _log_prob_and_grads(*variables):
+                log_prob, tape = _log_prob_and_tape(*variables)
+                grads = tape.gradient(
+                    log_prob, variables_list, unconnected_gradients=tf.UnconnectedGradients.ZERO
+                )
+                return log_prob, grads
+
+            @tf.custom_gradient
+            def _target_log_prob_fn_closure(*variables):
+                log_prob, grads = _log_prob_and_grads(*variables)
+
+                def grad_fn(dy, variables: Optional[tf.Tensor] = None):
+                    return [dy * grad for grad in grads], [None] * len(variables)
+
+                return log_prob, grad_fn
+
+            return _target_log_prob_fn_closure
+
         @tf.custom_gradient
         def _target_log_prob_fn_closure(*variables):
-            for v_old, v_new in zip(variables_list, variables):
-                v_old.assign(v_new)
-
-            with tf.GradientTape(watch_accessed_variables=False) as tape:
-                tape.watch(variables_list)
-                log_prob = self._target_log_prob_fn()
-                # Now need to correct for the fact that the prob fn is evaluated on the
-                # constrained space while we wish to evaluate it in the unconstrained space
-                for param in self._parameters:
-                    if param.transform is not None:
-                        x = param.unconstrained_variable
-                        log_det_jacobian = param.transform.forward_log_det_jacobian(
-                            x, x.shape.ndims
-                        )
-                        log_prob += tf.reduce_sum(log_det_jacobian)
-
-            @tf.function
+            log_prob, tape = _log_prob_and_tape(*variables)
+
             def grad_fn(dy, variables: Optional[tf.Tensor] = None):
                 grad = tape.gradient(log_prob, variables_list)
                 return grad, [None] * len(variables)
@@ -101,6 +150,21 @@ class SamplingHelper:
 
         return _target_log_prob_fn_closure
 
+    def _log_det_jacobian(self, unconstrained_values):
+        """
+        Sum over all parameters of the log-determinant of the Jacobian of their transforms,
+        evaluated at `unconstrained_values`. The terms are accumulated in a single reduction.
+        Returns None if no parameter has a transform.
+        """
+        log_det_jacobians = [
+            tf.reduce_sum(param.transform.forward_log_det_jacobian(x, ndims))
+            for param, x, ndims in zip(self._parameters, unconstrained_values, self._param_ndims)
+            if param.transform is not None
+        ]
+        if not log_det_jacobians:
+            return None
+        return tf.add_n(log_det_jacobians)
+
     def convert_to_constrained_values(self, hmc_samples):
         """
         Converts list of `unconstrained_values` to constrained versions. Each value in the
@@ -19,11 +19,21 @@ class Dispatcher(GeneratorDispatcher):
     def dispatch(self, *types):
         """
         Returns matching function for `types`; if not existing returns None.
+
+        Matches are memoized in the same cache that `__call__` uses, which is
+        cleared whenever a new implementation is registered.
         """
+        if types in self._cache:
+            return self._cache[types]
+
         if types in self.funcs:
-            return self.funcs[types]
+            func = self.funcs[types]
+        else:
+            func = self.get_first_occurrence(*types)
 
-        return self.get_first_occurrence(*types)
+        if func is not None:
+            self._cache[types] = func
+        return func
 
     def get_first_occurrence(self, *types):
         """ 
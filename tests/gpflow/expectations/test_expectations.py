@@ -153,6 +153,22 @@ def test_kernel_only_expectations(distribution, kernel, inducing_variable, arg_f
     _check(params)
 
 
+@pytest.mark.parametrize(
+    "kernel",
+    kerns("rbf", "lin", "rbf_act_dim_0", "rbf_act_dim_1", "lin_act_dim_0", "lin_act_dim_1"),
+)
+@pytest.mark.parametrize(
+    "arg_filter",
+    [lambda p, k, f: (p, k), lambda p, k, f: (p, (k, f)), lambda p, k, f: (p, (k, f), (k, f)),],
+)
+def test_diagonal_gaussian_matches_full_covariance(kernel, inducing_variable, arg_filter):
+    diagonal = _distrs["gauss_diag"]
+    full = Gaussian(diagonal.mu, tf.linalg.diag(diagonal.cov))
+    analytic_diagonal = expectation(*arg_filter(diagonal, kernel, inducing_variable))
+    analytic_full = expectation(*arg_filter(full, kernel, inducing_variable))
+    assert_allclose(analytic_diagonal, analytic_full, rtol=RTOL)
+
+
 @pytest.mark.parametrize("distribution", distr_args1)
 @pytest.mark.parametrize("kernel", kerns("rbf", "lin", "matern", "rbf_lin_sum"))
 @pytest.mark.parametrize("mean", mean_args)
@@ -166,6 +182,24 @@ def test_kernel_mean_function_expectations(
     _check(params)
 
 
+@pytest.mark.parametrize("kernel", kerns("rbf", "lin", "rbf_act_dim_0"))
+def test_linear_mean_function_expectation(kernel, inducing_variable):
+    """
+    The Linear-mean expectation evaluates exKxz and eKxz jointly; check it against the two
+    expectations computed separately. The analytic exKxz of the RBF kernel does not slice
+    active dimensions, so kernels with active_dims cannot be checked against quadrature.
+    """
+    p = _distrs["gauss"]
+    linear_mean = _means["lin"]
+    eAxKxz = expectation(p, linear_mean, (kernel, inducing_variable))  # NxQxM
+
+    exKxz = expectation(p, _means["identity"], (kernel, inducing_variable))  # NxDxM
+    eKxz = expectation(p, (kernel, inducing_variable))  # NxM
+    A, b = linear_mean.A.numpy(), linear_mean.b.numpy()
+    expected = np.einsum("dq,ndm->nqm", A, exKxz) + b[None, :, None] * eKxz[:, None, :]
+    assert_allclose(eAxKxz, expected, rtol=RTOL)
+
+
 @pytest.mark.parametrize("kernel", kern_args1)
 def test_eKdiag_no_uncertainty(kernel):
     eKdiag = expectation(_distrs["dirac_diag"], kernel)
@@ -249,6 +283,15 @@ def test_exKxz_markov(distribution, kernel, mean, inducing_variable):
     _check((distribution, (kernel, inducing_variable), mean))
 
 
+@pytest.mark.parametrize("distribution", distrs("gauss", "markov_gauss"))
+@pytest.mark.parametrize("kernel", kerns("lin"))
+@pytest.mark.parametrize("mean", means("identity"))
+def test_exKxz_transpose(distribution, kernel, mean, inducing_variable):
+    exKxz = expectation(distribution, mean, (kernel, inducing_variable))  # NxDxM
+    eKzxx = expectation(distribution, (kernel, inducing_variable), mean)  # NxMxD
+    assert_allclose(exKxz, np.transpose(eKzxx, (0, 2, 1)), rtol=RTOL)
+
+
 @pytest.mark.parametrize("distribution", distrs("dirac_markov_gauss"))
 @pytest.mark.parametrize("kernel", kern_args2)
 @pytest.mark.parametrize("mean", means("identity"))
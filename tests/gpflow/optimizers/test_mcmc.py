@@ -52,6 +52,21 @@ def test_mcmc_helper_parameters():
             )
 
 
+@pytest.mark.parametrize("experimental_compile", [False, True])
+def test_mcmc_helper_target_function_reused(experimental_compile):
+    """ Verifies that the target function is built once and returned on every access.
+    """
+    data = build_data()
+    model = build_model(data)
+
+    hmc_helper = gpflow.optimizers.SamplingHelper(
+        model.log_marginal_likelihood,
+        model.trainable_parameters,
+        experimental_compile=experimental_compile,
+    )
+    assert hmc_helper.target_log_prob_fn is hmc_helper.target_log_prob_fn
+
+
 def test_mcmc_helper_target_function_constrained():
     """ Set up priors on the model parameters such that we can
     readily compute their expected values. """
@@ -156,6 +171,49 @@ def test_mcmc_helper_target_function_no_transforms(prior_on):
     assert nones == [None] * len(model.trainable_parameters)
 
 
+@pytest.mark.parametrize("contexts", [("eager", "graph"), ("graph", "eager")])
+@pytest.mark.parametrize("change", ["none", "state"])
+def test_mcmc_helper_target_function_compiled(contexts, change):
+    """ Verifies that the XLA-compiled objective matches the uncompiled one, including its
+    gradient with respect to the unconstrained state, when called from eager mode and from
+    within a `tf.function`, and when evaluated again after moving to a new state.
+    """
+    data = build_data()
+    model = build_model(data)
+
+    hmc_helper = gpflow.optimizers.SamplingHelper(
+        model.log_marginal_likelihood, model.trainable_parameters
+    )
+    compiled_hmc_helper = gpflow.optimizers.SamplingHelper(
+        model.log_marginal_likelihood, model.trainable_parameters, experimental_compile=True
+    )
+
+    def value_and_gradient(target_log_prob_fn, state):
+        with tf.GradientTape() as tape:
+            tape.watch(state)
+            log_prob = target_log_prob_fn(*state)
+        return log_prob, tape.gradient(log_prob, state)
+
+    compiled_value_and_gradient = {
+        "eager": lambda state: value_and_gradient(compiled_hmc_helper.target_log_prob_fn, state),
+        "graph": tf.function(
+            lambda state: value_and_gradient(compiled_hmc_helper.target_log_prob_fn, state)
+        ),
+    }
+
+    state = [tf.identity(v) for v in hmc_helper.current_state]
+    for context in contexts:
+        if change == "state":
+            state = [v + to_default_float(0.1) for v in state]
+
+        log_prob, grads = value_and_gradient(hmc_helper.target_log_prob_fn, state)
+        compiled_log_prob, compiled_grads = compiled_value_and_gradient[context](state)
+
+        np.testing.assert_allclose(compiled_log_prob, log_prob)
+        for compiled_grad, grad in zip(compiled_grads, grads):
+            np.testing.assert_allclose(compiled_grad, grad)
+
+
 def test_mcmc_sampler_integration():
     data = build_data()
     model = build_model(data)
@@ -199,6 +257,31 @@ def test_mcmc_sampler_integration():
         assert hmc_helper._parameters[i].numpy() == parameter_samples[i][-1]
 
 
+def test_mcmc_helper_convert_to_constrained_values_after_transform_change():
+    """ Verifies that the conversion uses the transforms set at call time rather than those set
+    when the helper was constructed.
+    """
+    data = build_data()
+    model = build_model(data)
+
+    hmc_helper = gpflow.optimizers.SamplingHelper(
+        model.log_marginal_likelihood, model.trainable_parameters
+    )
+    samples = [
+        tf.fill((3,) + tuple(v.shape), to_default_float(0.5)) for v in hmc_helper.current_state
+    ]
+    hmc_helper.convert_to_constrained_values(samples)
+
+    for param in model.trainable_parameters:
+        if param.value() < 1e-3:
+            # Avoid values which would be pathological for the Exp transform
+            param.assign(1.0)
+        param.transform = Exp()
+
+    for value in hmc_helper.convert_to_constrained_values(samples):
+        np.testing.assert_allclose(value, np.exp(0.5))
+
+
 @pytest.mark.xfail(raises=ValueError)
 def test_helper_with_variables_fails():
     variable = tf.Variable(0.1)
@@ -67,6 +67,24 @@ def test_our_multipledispatch():
         assert len(w) == 0
 
 
+def test_dispatch_cache_invalidated_on_register():
+    test_fn = gpflow.utilities.Dispatcher("test_fn")
+
+    @test_fn.register(A1, B1)
+    def test_a1_b1(x, y):
+        return "a1-b1"
+
+    assert test_fn.dispatch(A2, B2) is test_a1_b1
+    assert test_fn._cache[(A2, B2)] is test_a1_b1
+
+    @test_fn.register(A2, B2)
+    def test_a2_b2(x, y):
+        return "a2-b2"
+
+    assert test_fn.dispatch(A2, B2) is test_a2_b2
+    assert test_fn(A2(), B2()) == "a2-b2"
+
+
 @pytest.mark.parametrize(
     "Dispatcher, expect_autograph_warning",
     [(multipledispatch.Dispatcher, True), (gpflow.utilities.Dispatcher, False),],